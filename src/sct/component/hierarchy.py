@@ -8,14 +8,27 @@ file. Without the SST Links, the configuration file would instantiate SST
 Components that do not have any functionality.
 """
 
+from array import array
+from bisect import bisect_left
+from collections import deque
+
 from .node import ComponentNode
 
+# delimiter between the connection name and its nested node types
+NODE_DELIM = "#"
+
 
 class Hierarchy:
     """
     Helper class to build SST Links from the ComponentNodes in an initialized
     ComponentTree object.
 
+    The nested tree is flattened once into pre-order parallel arrays, so that
+    every node is addressed by its index and the subtree rooted at a node
+    occupies the contiguous index range [index, __subtree_end[index]). The
+    traversals only read the integer arrays and never touch the ComponentNode
+    objects.
+
     Attributes
     ----------
     __tree: dict<ComponentNode, list<dict<ComponentNode>, list...>>
@@ -24,11 +37,46 @@ class Hierarchy:
     __hierarchy_links: list<tuple<str>>
         list of SST Links generated from the ComponentTree object's tree.
 
+    __nodes: list<ComponentNode>
+        the nodes of the tree in pre-order. The root is at index 0.
+
+    __types: array<int>
+        type of every node.
+
+    __links: list<list<ComponentLink>>
+        links of every node.
+
+    __parent_idx: array<int>
+        index of the parent of every node. The parent index of the root is -1.
+
+    __subtree_end: array<int>
+        exclusive end index of the subtree rooted at every node.
+
+    __id_to_idx: dict<int, int>
+        index of every node, keyed by the node id.
+
+    __by_type: dict<int, list<int>>
+        indices of the nodes in the tree grouped by their type.
+
+    __from_cache: dict<tuple<int, str>, tuple<ComponentNode, str>>
+        resolved output ports, keyed by the node id and the connection string.
+
+    __to_cache: dict<tuple<int, int, str>, tuple<ComponentNode, str>>
+        resolved input ports, keyed by the node id, the type of the node with
+        the input connection and the connection string.
+
+    __parse_cache: dict<str, tuple<str, tuple<int>>>
+        parsed connection strings, keyed by the connection string.
+
+    __path_cache: dict<int, tuple<int>>
+        types of the path from every visited node to the root, keyed by the
+        node index.
+
     Methods
     -------
     Public methods
     --------------
-    get_path_to_root(ComponentNode, list)
+    get_path_to_root(ComponentNode, tuple)
     get_parent(ComponentNode)
     get_sibling_subtree(ComponentNode, int)
     resolve_from_port(ComponentNode, str)
@@ -39,10 +87,10 @@ class Hierarchy:
 
     Private methods
     ---------------
-    __resolve_port(list, dict)
-    __find_node_by_attr(dict, str, int)
-    __get_parent(ComponentNode, dict)
-    __resolve_hierarchy(dict)
+    __index(dict)
+    __resolve_port(tuple, int)
+    __find_node_by_type(int, int)
+    __resolve_hierarchy()
     """
 
     def __init__(self, component_tree: dict) -> None:
@@ -61,45 +109,87 @@ class Hierarchy:
         self.__tree = component_tree
         self.__hierarchy_links = []
 
-    def __find_node_by_attr(self, subtree: dict, attr: str, data: int) -> tuple:
+        self.__nodes = []
+        self.__types = array("q")
+        self.__links = []
+        self.__parent_idx = array("q")
+        self.__subtree_end = array("q")
+        self.__id_to_idx = {}
+        self.__by_type = {}
+        self.__index(self.__tree)
+
+        self.__from_cache = {}
+        self.__to_cache = {}
+        self.__parse_cache = {}
+        self.__path_cache = {-1: ()}
+
+    def __index(self, tree: dict) -> None:
         """
-        Recursively searches for a node by the specified attribute type and
-        value.
-
-        For example, to locate a node with a "type" attribute of 10 in the
-        entire tree, run `__find_node_by_attr(tree, "type", 10)`.
+        Walks the tree once to flatten it into the pre-order node arrays, so
+        that lookups do not have to re-walk the nested tree.
 
         Params
         ------
-        subtree: dict<ComponentNode, list<dict<ComponentNode>, list...>>
-            A subtree of the tree to locate a node by the specified attribute.
+        tree: dict<ComponentNode, list<dict<ComponentNode>, list...>>
+            The tree to index.
 
-        attr: str
-            The attribute to locate the node with. The current attributes used
-            in the program are: {"id", "type"}
+        Returns
+        -------
+        None
+        """
+        # (subtree, parent index) pairs, children pushed in reverse to keep
+        # pre-order
+        stack = deque([(tree, -1)])
+        while stack:
+            subtree, parent = stack.pop()
+            for key, value in subtree.items():
+                idx = len(self.__nodes)
+                self.__nodes.append(key)
+                self.__types.append(key.type)
+                self.__links.append(key.links)
+                self.__parent_idx.append(parent)
+                self.__id_to_idx[key.id] = idx
+                self.__by_type.setdefault(key.type, []).append(idx)
+                stack.extend((node, idx) for node in reversed(value))
+
+        # accumulate the subtree sizes bottom-up, children always come after
+        # their parents in pre-order
+        sizes = [1] * len(self.__nodes)
+        for idx in range(len(self.__nodes) - 1, 0, -1):
+            sizes[self.__parent_idx[idx]] += sizes[idx]
+        self.__subtree_end = array(
+            "q", (idx + size for idx, size in enumerate(sizes))
+        )
+
+    def __find_node_by_type(self, root: int, node_type: int) -> int:
+        """
+        Searches the subtree rooted at the specified index for the first node,
+        in pre-order, with the specified type.
+
+        For example, to locate a node with a type of 10 in the entire tree, run
+        `__find_node_by_type(0, 10)`.
+
+        Params
+        ------
+        root: int
+            Index of the root of the subtree to locate the node in.
 
-        data: int
-            The value of the attribute to locate the node with. The current
-            attributes are both integer types.
+        node_type: int
+            The type of the node to locate.
 
         Returns
         -------
-        key, subtree: tuple<ComponentNode, dict>
-            a tuple of the found node and the subtree that was reduced from the
-            recursive calls. If the node was not found, None is returned.
+        int: the index of the found node. If the node was not found, None is
+        returned.
         """
-        for key, value in subtree.items():
-            if getattr(key, attr) == data:
-                return key, subtree
+        types = self.__types
+        for idx in range(root, self.__subtree_end[root]):
+            if types[idx] == node_type:
+                return idx
 
-            for node in value:
-                found = self.__find_node_by_attr(node, attr, data)
-                if found:
-                    return found
-
-    def get_path_to_root(self, node: ComponentNode, node_types_list: list) -> list:
+    def get_path_to_root(self, node: ComponentNode, node_types: tuple = ()) -> tuple:
         """
-        Generates a list of node types to represent the shortest path between
+        Generates a tuple of node types to represent the shortest path between
         the specified node and the root.
 
         Params
@@ -107,32 +197,38 @@ class Hierarchy:
         node: ComponentNode
             The specific node to find the shortest path to root.
 
-        node_types_list: list<int>
-            Initial list of node types between the specified node and the root.
+        node_types: tuple<int> = ()
+            Initial node types between the specified node and the root. The
+            tuple is not modified.
 
         Returns
         -------
-        list<int>: updated list of node types and the root.
+        tuple<int>: the initial node types followed by the types of the path
+        to the root.
         """
-        # append the type of the current node to the list
-        node_types_list.append(node.type)
-
-        # append the type of the current node's parent to the list
-        parent = self.get_parent(node)
-        node_types_list.append(parent.type)
-
-        # keep appending the types of the node's parents to the list until root
-        # root.type is always 0
-        while parent.type:
-            parent = self.get_parent(parent)
-            node_types_list.append(parent.type)
-
-        return node_types_list
+        types = self.__types
+        parent_idx = self.__parent_idx
+        path_cache = self.__path_cache
+
+        # climb until an ancestor with a known path, or past the root
+        uncached = []
+        idx = self.__id_to_idx[node.id]
+        while idx not in path_cache:
+            uncached.append(idx)
+            idx = parent_idx[idx]
+
+        # extend the known path back down to the current node, caching the
+        # path of every node on the way
+        path = path_cache[idx]
+        for idx in reversed(uncached):
+            path = (types[idx],) + path
+            path_cache[idx] = path
+
+        return node_types + path
 
     def get_parent(self, node: ComponentNode) -> ComponentNode:
         """
-        Initializes the recursive method to search for the parent of the
-        current ComponentNode.
+        Looks up the parent of the current ComponentNode in the parent index.
 
         Params
         ------
@@ -144,93 +240,89 @@ class Hierarchy:
         ComponentNode: the parent of the current node or None if no parents
         are found.
         """
-        return self.__get_parent(node, self.__tree)
+        parent = self.__parent_idx[self.__id_to_idx[node.id]]
+        return self.__nodes[parent] if parent != -1 else None
 
-    def __get_parent(self, node: ComponentNode, subtree: dict) -> ComponentNode:
+    def get_sibling_subtree(self, node: ComponentNode, sibling_node_type: int) -> int:
         """
-        Searches and returns the parent of the current ComponentNode.
+        Searches the closest ancestors of the current ComponentNode for a node
+        of the specified type.
 
         Params
         ------
         node: ComponentNode
-            The specific node to find the parent of.
+            The specific node to find the sibling of.
 
-        subtree: dict<ComponentNode, list<dict<ComponentNode>, list...>>
-            A subtree of the tree to locate the parent node.
+        sibling_node_type: int
+            The type of the sibling node.
 
         Returns
         -------
-        key: ComponentNode
-            parent node of the specified ComponentNode.
-        """
-        for key, value in subtree.items():
-            for k in value:
-
-                # if the id of the child node matches the current node, return
-                # the parent
-                if node.id == next(iter(k)).id:
-                    return key
+        int: the index of the root of the sibling subtree.
 
-                parent = self.__get_parent(node, k)
-                if parent:
-                    return parent
-
-    def get_sibling_subtree(self, node: ComponentNode, sibling_node_type: int) -> dict:
-
-        current_node, _ = self.__find_node_by_attr(self.__tree, "id", node.id)
-
-        current_parent = self.get_parent(current_node)
-        current_parent, subtree = self.__find_node_by_attr(
-            self.__tree, "id", current_parent.id
+        Raises
+        ------
+        LookupError: if no ancestor of the node contains a node of the
+        specified type.
+        """
+        # the candidates are in pre-order, so the first candidate inside an
+        # ancestor's subtree is the first one at or after the ancestor's index
+        candidates = self.__by_type.get(sibling_node_type, [])
+        current_parent = self.__parent_idx[self.__id_to_idx[node.id]]
+        while current_parent != -1:
+            i = bisect_left(candidates, current_parent)
+            end = self.__subtree_end[current_parent]
+            if i < len(candidates) and candidates[i] < end:
+                return candidates[i]
+
+            current_parent = self.__parent_idx[current_parent]
+
+        raise LookupError(
+            f"No node of type {sibling_node_type} found in the hierarchy of {node}"
         )
 
-        sibling_node = self.__find_node_by_attr(subtree, "type", sibling_node_type)
-        while not sibling_node:
-            current_parent = self.get_parent(current_parent)
-            current_parent, subtree = self.__find_node_by_attr(
-                self.__tree, "id", current_parent.id
-            )
-            sibling_node = self.__find_node_by_attr(subtree, "type", sibling_node_type)
-
-        else:
-            sibling_node, subtree = sibling_node
-
-        return subtree
+    def __resolve_port(self, node_types: tuple, root: int) -> ComponentNode:
 
-    def __resolve_port(self, node_types_list: list, subtree: dict) -> ComponentNode:
-
-        while node_types_list:
-            node, subtree = self.__find_node_by_attr(
-                subtree, "type", node_types_list.pop()
-            )
-            if not subtree[node]:
-                return node
+        # the outermost node type is last, descend from it to the first leaf
+        for node_type in reversed(node_types):
+            root = self.__find_node_by_type(root, node_type)
+            if self.__subtree_end[root] == root + 1:
+                return self.__nodes[root]
 
     def resolve_from_port(self, node: ComponentNode, connection: str) -> tuple:
 
-        connection_name, node_types_list = self.parse_connection(connection)
+        key = (node.id, connection)
+        if key in self.__from_cache:
+            return self.__from_cache[key]
 
-        if not node_types_list:
-            return node, connection_name
+        connection_name, node_types = self.parse_connection(connection)
 
-        node_types_list = self.get_path_to_root(node, node_types_list)
+        if not node_types:
+            resolved = node, connection_name
+        else:
+            node_types = self.get_path_to_root(node, node_types)
+            resolved = self.__resolve_port(node_types, 0), connection_name
 
-        subtree = self.__tree
-        return self.__resolve_port(node_types_list, subtree), connection_name
+        self.__from_cache[key] = resolved
+        return resolved
 
     def resolve_to_port(
         self, node: ComponentNode, to_node_type: int, connection: str
     ) -> tuple:
 
-        subtree = self.get_sibling_subtree(node, to_node_type)
-        connection_name, node_types_list = self.parse_connection(connection)
-        if not node_types_list:
-            return (
-                self.__find_node_by_attr(subtree, "type", to_node_type)[0],
-                connection_name,
-            )
+        key = (node.id, to_node_type, connection)
+        if key in self.__to_cache:
+            return self.__to_cache[key]
 
-        return self.__resolve_port(node_types_list, subtree), connection_name
+        sibling = self.get_sibling_subtree(node, to_node_type)
+        connection_name, node_types = self.parse_connection(connection)
+        if not node_types:
+            resolved = self.__nodes[sibling], connection_name
+        else:
+            resolved = self.__resolve_port(node_types, sibling), connection_name
+
+        self.__to_cache[key] = resolved
+        return resolved
 
     def parse_connection(self, connection: str) -> tuple:
         """
@@ -238,35 +330,44 @@ class Hierarchy:
 
         The connection string is split on the node delimiter. The first node of
         the list is the name of the connection, and the rest of the list is its
-        nested types.
+        nested types. The result is cached, so the nested types are returned as
+        an immutable tuple.
         """
-        connection_list = connection.split("#")
-        return connection_list[0], [int(i) for i in connection_list[1:]]
+        if connection in self.__parse_cache:
+            return self.__parse_cache[connection]
+
+        delim_idx = connection.find(NODE_DELIM)
+        if delim_idx < 0:
+            parsed = connection, ()
+        else:
+            parsed = (
+                connection[:delim_idx],
+                tuple(map(int, connection[delim_idx + 1 :].split(NODE_DELIM))),
+            )
+
+        self.__parse_cache[connection] = parsed
+        return parsed
 
     def resolve(self) -> None:
 
-        self.__resolve_hierarchy(self.__tree)
+        self.__resolve_hierarchy()
 
-    def __resolve_hierarchy(self, subtree: dict) -> None:
+    def __resolve_hierarchy(self) -> None:
 
-        for value in subtree.values():
-            if not value:
-                return
-            for node in value:
-                k = next(iter(node))
-                for link in k.links:
+        # a single pass over the nodes in pre-order, the root has no links
+        for k, links in zip(self.__nodes[1:], self.__links[1:]):
+            for link in links:
 
-                    from_node, from_port = self.resolve_from_port(k, link["from_port"])
-                    to_node, to_port = self.resolve_to_port(
-                        k,
-                        link["to_node_type"],
-                        link["to_port"],
-                    )
+                from_node, from_port = self.resolve_from_port(k, link.from_port)
+                to_node, to_port = self.resolve_to_port(
+                    k,
+                    link.to_node_type,
+                    link.to_port,
+                )
 
-                    self.__hierarchy_links.append(
-                        (*(from_node, from_port), *(to_node, to_port))
-                    )
-                self.__resolve_hierarchy(node)
+                self.__hierarchy_links.append(
+                    (*(from_node, from_port), *(to_node, to_port))
+                )
 
     def get_links(self) -> list:
 
@@ -0,0 +1,30 @@
+"""
+Represent a directed Drawflow connection as a ComponentLink with the data
+required to resolve an SST Link.
+
+ComponentLink objects are stored in the links of ComponentNode objects and are
+resolved to SST Links by Hierarchy objects.
+"""
+
+from typing import NamedTuple
+
+
+class ComponentLink(NamedTuple):
+    """
+    Structured representation of a Drawflow connection between two nodes.
+
+    Attributes
+    ----------
+    from_port: str
+        Name of the output connection of the current node.
+
+    to_node_type: int
+        Type of the node (Drawflow node "id") with the input connection.
+
+    to_port: str
+        Name of the input connection.
+    """
+
+    from_port: str
+    to_node_type: int
+    to_port: str
@@ -6,6 +6,13 @@ ComponentNode objects are intended to, but not restricted to, only work with
 ComponentTree objects.
 """
 
+import sys
+
+
+def _intern(value: str) -> str:
+    """Interns a string so that equal strings compare by identity"""
+    return sys.intern(value) if value is not None else None
+
 
 class ComponentNode:
     """
@@ -35,19 +42,13 @@ class ComponentNode:
         The nodes at every other level have parents that point to ComponentNode
         objects.
 
-    links: list<dict> = None
+    links: list<ComponentLink> = None
         List of bidirectional links represented by the directed connections in
-        the Drawflow canvas. A link is represented as followed:
-            `{
-                "from_port": str,
-                "to_node_type": int,
-                "to_port": str,
-            }`,
-        where:
-        "from_port" is the name of the output connection of the current node,
-        "to_node_type" is the type of node (Drawflow node "id") with the input
+        the Drawflow canvas. A link is represented as a ComponentLink with:
+        from_port, the name of the output connection of the current node,
+        to_node_type, the type of node (Drawflow node "id") with the input
         connection, and
-        "to_port" is the name of the input connection
+        to_port, the name of the input connection
 
     params: str = None
         Parameter values stored in the "data" field of the Drawflow nodes. A
@@ -71,6 +72,8 @@ class ComponentNode:
     __hash__
     """
 
+    __slots__ = ("class_name", "type", "name", "parent", "links", "params", "id")
+
     def __init__(
         self,
         class_name: str = None,
@@ -96,10 +99,10 @@ class ComponentNode:
         -------
         None
         """
-        self.class_name = class_name
+        self.class_name = _intern(class_name)
         self.type = type
-        self.name = name
-        self.parent = parent
+        self.name = _intern(name)
+        self.parent = _intern(parent)
         self.links = links
         self.params = params
         self.id = id(self)
@@ -116,7 +119,7 @@ class ComponentNode:
         -------
         None
         """
-        self.class_name = class_name
+        self.class_name = _intern(class_name)
 
     def set_type(self, type: int) -> None:
         """
@@ -144,7 +147,7 @@ class ComponentNode:
         -------
         None
         """
-        self.name = name
+        self.name = _intern(name)
 
     def set_parent(self, parent: str) -> None:
         """
@@ -158,7 +161,7 @@ class ComponentNode:
         -------
         None
         """
-        self.parent = parent
+        self.parent = _intern(parent)
 
     def set_links(self, links: list) -> None:
         """
@@ -217,4 +220,5 @@ class ComponentNode:
 
     def __hash__(self) -> int:
         """Overloaded the hash operator for the object"""
-        return hash(self.id)
+        # the id is already an int, which hashes to itself
+        return self.id
@@ -8,6 +8,8 @@ The object would however not be an accurate representation of the composition
 if the Drawflow node structure contains submodules.
 """
 
+from collections import Counter
+
 from .node import ComponentNode
 
 
@@ -39,12 +41,20 @@ class ComponentTree:
     __height: int
         Height of the tree.
 
+    __modules: dict<str, ComponentNode>
+        Modules (parent ComponentNode objects) in the composition, keyed by
+        their class_name.
+
+    __class_counts: Counter<str>
+        Number of occurrences of every ComponentNode class_name in the
+        composition.
+
     Methods
     -------
     Public methods
     --------------
     add_parent(str)
-    add_child(str, str, int, str, list, str)
+    add_child(str, str, str, list, str)
     find_module(str)
     decompress()
     get_leaves()
@@ -74,13 +84,13 @@ class ComponentTree:
         """
         self.__composition = composition
         self.root_key = root_key
+        self.__modules: dict = {}  # <dict(str: ComponentNode)>
 
         # if a composition is provided
         if self.__composition:
             for module in self.__composition.keys():
-                if module == self.root_key:
-                    self.__root = module
-                    break
+                self.__modules.setdefault(module.class_name, module)
+            self.__root = self.__modules.get(self.root_key)
         else:
             self.__composition = {}
             self.__root = None
@@ -88,6 +98,9 @@ class ComponentTree:
         self.__leaves: list = []  # <list(ComponentNode)>
         self.__tree: dict = {}  # <dict(ComponentNode: list(ComponentNode))>
         self.__height: int = 0
+        self.__class_counts: Counter = Counter(
+            node.class_name for nodes in self.__composition.values() for node in nodes
+        )
 
     def add_parent(self, parent_name: str) -> None:
         """
@@ -108,12 +121,12 @@ class ComponentTree:
         """
         module_node = ComponentNode(class_name=parent_name, name=parent_name)
         self.__composition[module_node] = []
+        self.__modules.setdefault(parent_name, module_node)
 
     def add_child(
         self,
         parent_name: str,
         node_name: str,
-        node_index: int,
         node_type: str,
         node_links: list,
         node_params: str,
@@ -129,11 +142,6 @@ class ComponentTree:
         node_name: str
             Name of the current ComponentNode
 
-        node_index: int
-            The index of the current ComponentNode's parent's children. The
-            index does not signify a precedence or priority within the
-            children nodes.
-
         node_type: str
             The type of the current ComponentNode.
 
@@ -148,17 +156,18 @@ class ComponentTree:
         None
         """
         module_node = self.find_module(parent_name)
-
-        # append a new ComponentNode object with ComponentNode.class_name
-        self.__composition[module_node].append(ComponentNode(class_name=node_name))
-        node = self.__composition[module_node][node_index]
-
-        node.set_parent(parent_name)
         node_count = self.__get_node_count(node_name)
-        node.set_name(self.__get_node_name(node_name, node_count))
-        node.set_type(node_type)
-        node.set_links(node_links)
-        node.set_params(node_params)
+
+        # build the ComponentNode object once and append it to its module
+        node = ComponentNode(
+            class_name=node_name,
+            type=node_type,
+            name=self.__get_node_name(node_name, node_count),
+            parent=parent_name,
+            links=node_links,
+            params=node_params,
+        )
+        self.__composition[module_node].append(node)
 
     def __get_node_name(self, node_name: str, count: int) -> str:
         """
@@ -183,7 +192,7 @@ class ComponentTree:
     def __get_node_count(self, node_class_name: str) -> int:
         """
         Count the occurrence of the current ComponentNode's class_name in the
-        composition.
+        composition, and record the new occurrence.
 
         Params
         ------
@@ -195,9 +204,8 @@ class ComponentTree:
         count: int
             the occurrence of the current ComponentNode's class_name.
         """
-        count = -1
-        for module in self.__composition.keys():
-            count += self.__composition[module].count(node_class_name)
+        count = self.__class_counts[node_class_name]
+        self.__class_counts[node_class_name] += 1
 
         return count
 
@@ -215,9 +223,7 @@ class ComponentTree:
         ComponentNode: the found parent ComponentNode or
         None: if the parent ComponentNode was not found.
         """
-        for module in self.__composition.keys():
-            if module == node_name:
-                return module
+        return self.__modules.get(node_name)
 
     def __get_children(self, node: ComponentNode) -> list:
         """
@@ -232,26 +238,25 @@ class ComponentTree:
         -------
         list<ComponentNode>: list of newly generated ComponentNode children.
         """
-        # iterating through the keys
-        for module in self.__composition:
-            # if the module key is found
-            if module == node:
-                # new and unique instances of ComponentNode objects with
-                # attributes identical to the original copies
-                return [
-                    ComponentNode(
-                        class_name=i.class_name,
-                        type=i.type,
-                        parent=i.parent,
-                        name=i.name,
-                        links=i.links,
-                        params=i.params,
-                    )
-                    for i in self.__composition[module]
-                ]
+        module = self.__modules.get(node.class_name)
 
         # node is a leaf
-        return []
+        if module is None:
+            return []
+
+        # new and unique instances of ComponentNode objects with attributes
+        # identical to the original copies
+        return [
+            ComponentNode(
+                class_name=i.class_name,
+                type=i.type,
+                parent=i.parent,
+                name=i.name,
+                links=i.links,
+                params=i.params,
+            )
+            for i in self.__composition[module]
+        ]
 
     def __decompress(self, node: ComponentNode) -> dict:
         """
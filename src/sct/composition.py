@@ -5,6 +5,7 @@ from .boilerplate.sst import (
     COMPONENT_LINK,
     COMPONENT_PARAM,
 )
+from .component.link import ComponentLink
 from .component.tree import ComponentTree
 from .component.hierarchy import Hierarchy
 
@@ -19,29 +20,22 @@ class CompositionParser:
         self.__links_str_list = []
         self.__resolved_links = []
 
-    def __copy_connections(self, component: dict, component_list: dict) -> None:
+    def __copy_connections(self, component: dict, input_names: dict) -> list:
 
         output_names = component["data"]["links"]["outputs"]
         output_conns = component["outputs"].values()
-        links = []
-        for output_name, output_conn in zip(output_names, output_conns):
-            for conn in output_conn["connections"]:
-                to_node_type = conn["node"]
-                to_node_conn_name = conn["output"]
-                to_node_conn_num = int(to_node_conn_name[-1]) - 1
-                to_node_port = component_list[to_node_type]["data"]["links"]["inputs"][
-                    to_node_conn_num
-                ]
-
-                links.append(
-                    {
-                        "from_port": output_name,
-                        "to_node_type": int(to_node_type),
-                        "to_port": to_node_port,
-                    }
-                )
 
-        return links
+        # the "output" field of a connection is the 1-based "input_<n>" of the
+        # connected node
+        return [
+            ComponentLink(
+                from_port=output_name,
+                to_node_type=int(conn["node"]),
+                to_port=input_names[conn["node"]][int(conn["output"][-1]) - 1],
+            )
+            for output_name, output_conn in zip(output_names, output_conns)
+            for conn in output_conn["connections"]
+        ]
 
     def filter(self) -> None:
 
@@ -51,15 +45,20 @@ class CompositionParser:
 
             for component_list in module.values():
 
-                for component_index, component in enumerate(component_list.values()):
+                # input port names of every component in the module
+                input_names = {
+                    node_type: component["data"]["links"]["inputs"]
+                    for node_type, component in component_list.items()
+                }
+
+                for component in component_list.values():
 
                     # append a new ComponentNode object with ComponentNode.class_name
                     self.__ctree.add_child(
                         module_name,
                         component["name"],
-                        component_index,
                         component["id"],
-                        self.__copy_connections(component, component_list),
+                        self.__copy_connections(component, input_names),
                         str(component["data"]["param"]),
                     )
 
@@ -71,7 +70,7 @@ class CompositionParser:
     def dump_raw_data(self, file_name="dump.json") -> None:
 
         with open(file_name, "w") as dump_file:
-            json.dump(self.__raw_data, dump_file, indent=4)
+            json.dump(self.__raw_data, dump_file, separators=(",", ":"))
 
     def resolve_hierarchy(self) -> None:
 
@@ -93,27 +92,32 @@ class CompositionParser:
     def generate_config(self) -> None:
 
         leaves = self.__ctree.get_leaves()
+
+        # component variable names, formatted once per leaf instead of once per
+        # reference in the links
+        names = {leaf.id: str(leaf) for leaf in leaves}
         for leaf in leaves:
             self.__components_str_list.append(
                 COMPONENT_INIT.format(
-                    name=leaf, library=self.__library, class_name=leaf.class_name
+                    name=names[leaf.id],
+                    library=self.__library,
+                    class_name=leaf.class_name,
                 )
             )
             self.__components_str_list.append(
-                COMPONENT_PARAM.format(name=leaf, params=leaf.params)
+                COMPONENT_PARAM.format(name=names[leaf.id], params=leaf.params)
             )
 
         self.__resolved_links = sorted(self.__resolved_links, key=lambda x: x[0].id)
-        for link in self.__resolved_links:
-            comp_out, link_out, comp_in, link_in = link
-            self.__links_str_list.append(
-                COMPONENT_LINK.format(
-                    comp_out=comp_out,
-                    link_out=link_out,
-                    comp_in=comp_in,
-                    link_in=link_in,
-                )
+        self.__links_str_list.extend(
+            COMPONENT_LINK.format(
+                comp_out=names[comp_out.id],
+                link_out=link_out,
+                comp_in=names[comp_in.id],
+                link_in=link_in,
             )
+            for comp_out, link_out, comp_in, link_in in self.__resolved_links
+        )
 
     def get_config(self) -> dict:
 
@@ -0,0 +1,36 @@
+import pytest
+
+from sct.component.hierarchy import Hierarchy
+from sct.component.link import ComponentLink
+from sct.component.node import ComponentNode
+
+
+def build_tree(to_node_type: int) -> tuple:
+
+    root = ComponentNode(class_name="Home", name="Home")
+    from_node = ComponentNode(
+        class_name="a",
+        type=1,
+        links=[ComponentLink("out", to_node_type, "in")],
+    )
+    to_node = ComponentNode(class_name="b", type=2, links=[])
+
+    return {root: [{from_node: []}, {to_node: []}]}, from_node, to_node
+
+
+def test_resolve_sibling_link():
+
+    tree, from_node, to_node = build_tree(2)
+    hr = Hierarchy(tree)
+    hr.resolve()
+
+    assert hr.get_links() == [(from_node, "out", to_node, "in")]
+
+
+def test_resolve_missing_sibling_type():
+
+    tree, _, _ = build_tree(99)
+    hr = Hierarchy(tree)
+
+    with pytest.raises(LookupError):
+        hr.resolve()